@@ -3,17 +3,18 @@ import logging
 from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
-from src.parser import ReviewParser, Review, NetworkError, ParsingError
-from src.analyzer import SentimentAnalyzer
-from src.translator import TextTranslator
-from src.notifier import TelegramNotifier
 from src.security import SecurityManager, SecurityError, ValidationError
+from src.review_cache import ReviewCache
 from src.logger import setup_logging, log_error, log_performance
 from src.config import ConfigManager
 import concurrent.futures
 from collections import defaultdict
 import time
 
+# Кэш отзывов хранится в формате JSONL: сохранение дозаписывает только
+# новые записи, а не пересериализует весь кэш
+CACHE_FILE = 'reviews_cache.jsonl'
+
 def load_config(security_manager: SecurityManager) -> dict:
     """Загрузка конфигурации с проверкой безопасности"""
     try:
@@ -30,42 +31,96 @@ def load_config(security_manager: SecurityManager) -> dict:
         log_error(logging.getLogger(__name__), 'Неожиданная ошибка при загрузке конфигурации', e)
         raise
 
-def load_cache(security_manager: SecurityManager) -> list:
+def load_cache(security_manager: SecurityManager) -> ReviewCache:
     """Загрузка кэша с проверкой безопасности"""
     try:
-        cache = security_manager.load_secure_cache('reviews_cache.json')
+        records = security_manager.load_secure_cache(CACHE_FILE)
+        cache = ReviewCache.from_records(records)
+        # Дозаписываем только то, что появилось после загрузки; кэш из
+        # старого формата (.json) сохраняется в JSONL целиком
+        if Path(CACHE_FILE).exists():
+            cache.persisted_count = len(cache)
         logging.info('Кэш загружен', extra={'cache_size': len(cache)})
         return cache
     except SecurityError as e:
         log_error(logging.getLogger(__name__), 'Ошибка безопасности при загрузке кэша', e)
-        return []
+        return ReviewCache()
     except ValidationError as e:
         log_error(logging.getLogger(__name__), 'Ошибка валидации кэша', e)
-        return []
+        return ReviewCache()
     except Exception as e:
         log_error(logging.getLogger(__name__), 'Неожиданная ошибка при загрузке кэша', e)
-        return []
+        return ReviewCache()
 
-def save_cache(security_manager: SecurityManager, cache: list) -> None:
+def save_cache(security_manager: SecurityManager, cache: ReviewCache) -> None:
     """Сохранение кэша с проверкой безопасности"""
     try:
-        security_manager.save_secure_cache('reviews_cache.json', cache)
-        logging.info('Кэш сохранен', extra={'cache_size': len(cache)})
+        new_records = cache.to_records(cache.persisted_count)
+        security_manager.append_secure_cache(CACHE_FILE, new_records)
+        # Индекс дайджестов сохраняется строго после успешной дозаписи
+        # кэша: иначе упавшая запись оставила бы отзывы помеченными как
+        # обработанные, но отсутствующими в кэше
+        security_manager.save_hash_index()
+        cache.persisted_count = len(cache)
+        logging.info('Кэш сохранен', extra={'cache_size': len(cache), 'new_records': len(new_records)})
     except Exception as e:
         log_error(logging.getLogger(__name__), 'Ошибка при сохранении кэша', e)
 
+def _parse_single_url(parser_kwargs: dict, url: str) -> list:
+    """Сбор отзывов с одного URL в отдельном парсере"""
+    from src.parser import ReviewParser
+
+    parser = ReviewParser(**parser_kwargs)
+    try:
+        return parser.parse_reviews(url)
+    finally:
+        parser.cleanup()
+
+def collect_reviews(parser: 'ReviewParser', urls: List[str]) -> list:
+    """Сбор отзывов с одного или нескольких URL
+
+    Для одного URL используется переданный парсер. Для нескольких URL
+    парсинг выполняется параллельно, по отдельному драйверу на источник,
+    чтобы время сбора определялось самым медленным источником, а не
+    суммой всех.
+    """
+    if len(urls) == 1:
+        return parser.parse_reviews(urls[0])
+
+    parser_kwargs = {
+        'max_retries': parser.max_retries,
+        'timeout': parser.timeout,
+        'max_workers': parser.max_workers
+    }
+    reviews = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(urls), parser.max_workers)) as executor:
+        future_to_url = {
+            executor.submit(_parse_single_url, parser_kwargs, url): url
+            for url in urls
+        }
+        for future in concurrent.futures.as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                reviews.extend(future.result())
+            except Exception as e:
+                log_error(logging.getLogger(__name__), f'Ошибка при сборе отзывов с {url}', e)
+    return reviews
+
 def process_reviews_batch(
-    parser: ReviewParser,
-    analyzer: SentimentAnalyzer,
+    parser: 'ReviewParser',
+    analyzer: 'SentimentAnalyzer',
     security_manager: SecurityManager,
     url: str,
-    cache: list
-) -> list:
+    cache: ReviewCache
+) -> ReviewCache:
     """Обработка пакета отзывов"""
+    from src.parser import NetworkError, ParsingError
+
     start_time = time.time()
     try:
-        # Получаем отзывы
-        reviews = parser.parse_reviews(url)
+        # Получаем отзывы (url может быть списком источников)
+        urls = [url] if isinstance(url, str) else list(url)
+        reviews = collect_reviews(parser, urls)
         log_performance(
             logging.getLogger(__name__),
             'parsing_reviews',
@@ -73,38 +128,54 @@ def process_reviews_batch(
             {'reviews_count': len(reviews)}
         )
         
-        # Фильтруем новые отзывы
+        # Фильтруем новые отзывы через индекс дайджестов, которым владеет
+        # SecurityManager: индекс строится один раз при загрузке кэша и
+        # переживает перезапуски через сайдкар-файл
         new_reviews = []
+        batch_hashes = set()
         for review in reviews:
             review_hash = security_manager.hash_data(review.text)
-            if not any(cached['hash'] == review_hash for cached in cache):
-                new_reviews.append(review)
-        
+            if review_hash in batch_hashes or security_manager.is_duplicate(review.text):
+                continue
+            batch_hashes.add(review_hash)
+            new_reviews.append((review, review_hash))
+
         if not new_reviews:
             logging.info('Новых отзывов не найдено')
             return cache
-            
+
         # Анализируем отзывы
         analysis_start = time.time()
-        for review in new_reviews:
+
+        # Сначала валидируем отзывы, отбрасывая некорректные; в индекс
+        # дедупликации попадают только прошедшие валидацию — отзыв,
+        # отброшенный валидатором, не помечается как обработанный.
+        # validate_review работает со словарем полей и возвращает bool
+        valid_reviews = []
+        valid_hashes = []
+        for review, review_hash in new_reviews:
+            if not security_manager.validate_review(review.__dict__):
+                logging.warning(f'Отзыв не прошел валидацию: {review.text[:100]}...')
+                continue
+            valid_reviews.append(review)
+            valid_hashes.append(security_manager.register_review(review.text))
+
+        # Анализируем тональность одной пачкой вместо поштучных вызовов
+        sentiments = analyzer.analyze_texts([review.text for review in valid_reviews])
+
+        for review, review_hash, (sentiment, lang) in zip(valid_reviews, valid_hashes, sentiments):
             try:
-                # Валидируем отзыв
-                security_manager.validate_review(review)
-                
-                # Анализируем тональность
-                sentiment, lang = analyzer.analyze_sentiment(review.text)
-                
                 # Добавляем в кэш
-                cache.append({
-                    'text': review.text,
-                    'hash': security_manager.hash_data(review.text),
-                    'sentiment': sentiment,
-                    'language': lang,
-                    'rating': review.rating,
-                    'author': review.author,
-                    'date': review.date
-                })
-                
+                cache.append(
+                    text=review.text,
+                    hash_hex=review_hash,
+                    sentiment=sentiment,
+                    language=lang,
+                    rating=review.rating,
+                    author=review.author,
+                    date=review.date
+                )
+
                 # Логируем информацию об отзыве
                 logging.info(
                     'Обработан отзыв',
@@ -115,27 +186,21 @@ def process_reviews_batch(
                         'author': review.author
                     }
                 )
-                
-            except ValidationError as e:
-                log_error(
-                    logging.getLogger(__name__),
-                    f'Отзыв не прошел валидацию: {review.text[:100]}...',
-                    e
-                )
+
             except Exception as e:
                 log_error(
                     logging.getLogger(__name__),
                     f'Ошибка при обработке отзыва: {review.text[:100]}...',
                     e
                 )
-        
+
         log_performance(
             logging.getLogger(__name__),
             'analyzing_reviews',
             time.time() - analysis_start,
             {'reviews_count': len(new_reviews)}
         )
-        
+
         return cache
         
     except NetworkError as e:
@@ -151,6 +216,12 @@ def process_reviews_batch(
 def main():
     """Основная функция программы"""
     try:
+        # Тяжелые модули (selenium, textblob, telegram) импортируем только
+        # здесь, чтобы не оплачивать их на старте вспомогательных команд
+        from src.parser import ReviewParser
+        from src.analyzer import SentimentAnalyzer
+        from src.notifier import TelegramNotifier
+
         # Загружаем конфигурацию
         config_manager = ConfigManager()
         config = config_manager.load_config()
@@ -180,6 +251,8 @@ def main():
             min_confidence=analyzer_config.min_confidence,
             batch_size=analyzer_config.batch_size
         )
+        # Загружаем модели один раз до обработки первого пакета
+        analyzer.warm_up()
         
         notifier_config = config_manager.get_notifier_config()
         if notifier_config.enabled:
@@ -195,7 +268,7 @@ def main():
         if cache_config.enabled:
             cache = load_cache(security_manager)
         else:
-            cache = []
+            cache = ReviewCache()
         
         # Обрабатываем отзывы
         cache = process_reviews_batch(
@@ -210,27 +283,28 @@ def main():
         if cache_config.enabled:
             save_cache(security_manager, cache)
         
-        # Логируем статистику
-        if cache:
-            sentiments = [review['sentiment'] for review in cache]
-            languages = [review['language'] for review in cache]
-            
+        # Логируем статистику: каждая метрика считается ровно один раз
+        if len(cache):
+            total_reviews = len(cache)
+            average_sentiment = sum(cache.sentiments) / total_reviews
+            languages = set(cache.languages)
+
             logging.info(
                 'Статистика обработки',
                 extra={
-                    'total_reviews': len(cache),
-                    'average_sentiment': sum(sentiments) / len(sentiments),
-                    'languages': list(set(languages))
+                    'total_reviews': total_reviews,
+                    'average_sentiment': average_sentiment,
+                    'languages': list(languages)
                 }
             )
-            
+
             # Отправляем уведомление о завершении
             if notifier_config.enabled and notifier_config.notify_on_shutdown:
                 notifier.send_message(
                     f'Обработка завершена\n'
-                    f'Всего отзывов: {len(cache)}\n'
-                    f'Средняя тональность: {sum(sentiments) / len(sentiments):.2f}\n'
-                    f'Языки: {", ".join(set(languages))}'
+                    f'Всего отзывов: {total_reviews}\n'
+                    f'Средняя тональность: {average_sentiment:.2f}\n'
+                    f'Языки: {", ".join(languages)}'
                 )
         
     except Exception as e:
@@ -1,50 +1,235 @@
 import logging
 from typing import Tuple, Optional, Dict, List
-from textblob import TextBlob
-from langdetect import detect, LangDetectException
-from src.translator import TextTranslator
 import re
-from functools import lru_cache
-import concurrent.futures
-from collections import defaultdict
+from collections import defaultdict, Counter
 import threading
 
+# Скомпилированные паттерны предобработки текста
+_RE_NONWORD = re.compile(r'[^\w\s.,!?-]')
+_RE_WS = re.compile(r'\s+')
+
+# Размер кэшей тональности и языка
+_CACHE_MAXSIZE = 4096
+
+# Минимальная длина текста, при которой перевод имеет смысл
+_MIN_TRANSLATE_LEN = 8
+
+try:
+    import xxhash
+
+    def _text_digest(text: str) -> int:
+        """64-битный дайджест текста для ключей кэша"""
+        return xxhash.xxh3_64_intdigest(text)
+except ImportError:
+    def _text_digest(text: str) -> int:
+        """64-битный дайджест текста для ключей кэша (fallback на hash)"""
+        return hash(text)
+
+# Лениво загружаемые тяжелые зависимости (textblob, langdetect)
+_textblob_cls = None
+_langdetect = None
+
+def _get_textblob():
+    """Ленивый импорт TextBlob"""
+    global _textblob_cls
+    if _textblob_cls is None:
+        from textblob import TextBlob
+        _textblob_cls = TextBlob
+    return _textblob_cls
+
+def _get_langdetect():
+    """Ленивый импорт langdetect"""
+    global _langdetect
+    if _langdetect is None:
+        import langdetect
+        _langdetect = langdetect
+    return _langdetect
+
+# Модель fastText lid.176 (опциональная зависимость): C-реализация,
+# на порядки быстрее langdetect и поддерживает пакетный predict
+_FASTTEXT_MODEL_PATH = 'lid.176.ftz'
+_fasttext_model = None
+_fasttext_unavailable = False
+
+def _get_fasttext_model():
+    """Ленивая загрузка модели fastText, None если она недоступна"""
+    global _fasttext_model, _fasttext_unavailable
+    if _fasttext_model is None and not _fasttext_unavailable:
+        try:
+            import fasttext
+            _fasttext_model = fasttext.load_model(_FASTTEXT_MODEL_PATH)
+        except Exception:
+            _fasttext_unavailable = True
+    return _fasttext_model
+
 class SentimentAnalyzer:
-    def __init__(self, target_language: str = 'en', max_workers: int = 4):
+    def __init__(self, target_language: str = 'en', max_workers: int = 4,
+                 min_confidence: float = 0.6, batch_size: int = 10):
+        from src.translator import TextTranslator
+
         self.logger = logging.getLogger(__name__)
         self.target_language = target_language
         self.max_workers = max_workers
+        self.min_confidence = min_confidence
+        self.batch_size = batch_size
         self.translator = TextTranslator()
         self._sentiment_cache = {}
         self._language_cache = {}
         self._cache_lock = threading.Lock()
-        
-    @lru_cache(maxsize=1000)
+        self._analyze = self._make_analyzer()
+
+    def _make_analyzer(self):
+        """Строит специализированную функцию анализа под целевой язык
+
+        Все зависимости горячего пути (предобработка, детектор языка,
+        переводчик, целевой язык) фиксируются как локальные переменные
+        замыкания, поэтому внутренний цикл обходится без атрибутных
+        обращений через self.
+        """
+        target = self.target_language
+        ascii_fast_path = target == 'en'
+        preprocess = self._preprocess_text
+        detect = self._detect_language
+        translate = self.translator.translate
+        get_sentiment = self._get_sentiment
+        logger = self.logger
+
+        def analyze(text: str) -> Tuple[float, str]:
+            if not text or not isinstance(text, str):
+                return 0.0, 'unknown'
+
+            text = preprocess(text)
+            if not text:
+                return 0.0, 'unknown'
+
+            # ASCII-текст при целевом английском не требует ни
+            # определения языка, ни перевода
+            if ascii_fast_path and text.isascii():
+                return get_sentiment(text), 'en'
+
+            detected_lang = detect(text)
+
+            if detected_lang != target and detected_lang != 'unknown' \
+                    and len(text) >= _MIN_TRANSLATE_LEN:
+                try:
+                    text = translate(text, target)
+                except Exception as e:
+                    logger.error(f'Translation error: {str(e)}')
+                    return 0.0, detected_lang
+
+            return get_sentiment(text), detected_lang
+
+        return analyze
+
+    def warm_up(self) -> None:
+        """Предзагрузка моделей анализатора
+
+        Лениво загружаемые компоненты (TextBlob, langdetect, модель
+        fastText) подгружаются один раз заранее, чтобы первый пакет
+        отзывов не оплачивал их инициализацию.
+        """
+        try:
+            _get_textblob()
+            _get_langdetect()
+            _get_fasttext_model()
+        except Exception as e:
+            self.logger.warning(f'Error warming up analyzer: {str(e)}')
+
+    def _cache_get(self, cache: dict, digest: int):
+        """Чтение из ограниченного кэша по дайджесту"""
+        with self._cache_lock:
+            return cache.get(digest)
+
+    def _cache_put(self, cache: dict, digest: int, value) -> None:
+        """Запись в ограниченный кэш с вытеснением самой старой записи"""
+        with self._cache_lock:
+            if len(cache) >= _CACHE_MAXSIZE:
+                cache.pop(next(iter(cache)))
+            cache[digest] = value
+
     def _detect_language(self, text: str) -> str:
-        """Определение языка текста с кэшированием"""
+        """Определение языка текста с кэшированием по дайджесту"""
         if not text or not isinstance(text, str):
             return 'unknown'
-            
+
+        digest = _text_digest(text)
+        cached = self._cache_get(self._language_cache, digest)
+        if cached is not None:
+            return cached
+
+        lang = self._detect_language_uncached(text)
+        self._cache_put(self._language_cache, digest, lang)
+        return lang
+
+    def _detect_language_uncached(self, text: str) -> str:
+        """Определение языка текста без кэша"""
+        # Быстрый путь: fastText, если модель доступна
+        model = _get_fasttext_model()
+        if model is not None:
+            try:
+                labels, probs = model.predict(text.replace('\n', ' '))
+                if labels and probs[0] >= self.min_confidence:
+                    return labels[0].replace('__label__', '')
+                return 'unknown'
+            except Exception as e:
+                self.logger.warning(f'fastText detection error: {str(e)}')
+
+        langdetect = _get_langdetect()
         try:
-            return detect(text)
-        except LangDetectException:
+            # detect_langs возвращает кандидата с вероятностью одним
+            # вызовом; неуверенные определения отбрасываем по порогу
+            top = langdetect.detect_langs(text)[0]
+            return top.lang if top.prob >= self.min_confidence else 'unknown'
+        except langdetect.LangDetectException:
             self.logger.warning('Could not detect language')
             return 'unknown'
         except Exception as e:
             self.logger.warning(f'Error detecting language: {str(e)}')
             return 'unknown'
+
+    def _detect_language_batch(self, texts: List[str]) -> List[str]:
+        """Пакетное определение языка
+
+        При наличии fastText весь список обрабатывается одним вызовом
+        predict; иначе выполняется поэлементный fallback на langdetect.
+        """
+        if not texts:
+            return []
+
+        model = _get_fasttext_model()
+        if model is not None:
+            try:
+                labels, probs = model.predict([t.replace('\n', ' ') for t in texts])
+                # Порог уверенности применяется как и в одиночном пути:
+                # неуверенные определения отбрасываются
+                return [
+                    l[0].replace('__label__', '')
+                    if l and p[0] >= self.min_confidence else 'unknown'
+                    for l, p in zip(labels, probs)
+                ]
+            except Exception as e:
+                self.logger.warning(f'fastText batch detection error: {str(e)}')
+
+        return [self._detect_language(text) for text in texts]
             
-    @lru_cache(maxsize=1000)
     def _get_sentiment(self, text: str) -> float:
-        """Получение тональности текста с кэшированием"""
+        """Получение тональности текста с кэшированием по дайджесту"""
         if not text or not isinstance(text, str):
             return 0.0
-            
+
+        digest = _text_digest(text)
+        cached = self._cache_get(self._sentiment_cache, digest)
+        if cached is not None:
+            return cached
+
         try:
-            return TextBlob(text).sentiment.polarity
+            sentiment = _get_textblob()(text).sentiment.polarity
         except Exception as e:
             self.logger.error(f'Error analyzing sentiment: {str(e)}')
             return 0.0
+
+        self._cache_put(self._sentiment_cache, digest, sentiment)
+        return sentiment
             
     def _preprocess_text(self, text: str) -> str:
         """Предобработка текста"""
@@ -52,57 +237,68 @@ class SentimentAnalyzer:
             return ''
             
         # Удаляем специальные символы и лишние пробелы
-        text = re.sub(r'[^\w\s.,!?-]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _RE_WS.sub(' ', _RE_NONWORD.sub(' ', text)).strip()
         
     def analyze_sentiment(self, text: str) -> Tuple[float, str]:
         """Анализ тональности текста с определением языка"""
-        if not text or not isinstance(text, str):
-            return 0.0, 'unknown'
-            
         try:
-            # Предобработка текста
-            text = self._preprocess_text(text)
-            if not text:
-                return 0.0, 'unknown'
-            
-            # Определяем язык
-            detected_lang = self._detect_language(text)
-            
-            # Если язык не английский, переводим
-            if detected_lang != self.target_language:
-                try:
-                    text = self.translator.translate(text, self.target_language)
-                except Exception as e:
-                    self.logger.error(f'Translation error: {str(e)}')
-                    return 0.0, detected_lang
-                
-            # Анализируем тональность
-            sentiment = self._get_sentiment(text)
-            
-            return sentiment, detected_lang
-            
+            return self._analyze(text)
         except Exception as e:
             self.logger.error(f'Error in sentiment analysis: {str(e)}')
             return 0.0, 'unknown'
             
-    def analyze_batch(self, texts: List[str]) -> List[Tuple[float, str]]:
-        """Пакетный анализ тональности"""
+    def analyze_texts(self, texts: List[str]) -> List[Tuple[float, str]]:
+        """Пакетный анализ тональности с группировкой по языкам
+
+        Тексты предобрабатываются одним проходом, группируются по
+        определенному языку и переводятся одной пачкой на группу,
+        после чего тональность считается для всех текстов сразу.
+        """
         if not texts:
             return []
-            
-        results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_text = {executor.submit(self.analyze_sentiment, text): text for text in texts}
-            for future in concurrent.futures.as_completed(future_to_text):
+
+        # Предобработка одним проходом
+        prepared = [self._preprocess_text(t) if isinstance(t, str) else '' for t in texts]
+
+        results: List[Tuple[float, str]] = [(0.0, 'unknown')] * len(texts)
+
+        # Группируем тексты по языку, сохраняя исходные индексы;
+        # язык определяется одним пакетным вызовом
+        non_empty = [i for i, text in enumerate(prepared) if text]
+        languages = self._detect_language_batch([prepared[i] for i in non_empty])
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for i, lang in zip(non_empty, languages):
+            groups[lang].append(i)
+
+        for lang, indices in groups.items():
+            group_texts = [prepared[i] for i in indices]
+
+            # Переводим всю группу одной пачкой, если язык не целевой
+            if lang not in (self.target_language, 'unknown'):
                 try:
-                    result = future.result()
-                    results.append(result)
+                    group_texts = self.translator.translate_batch(group_texts, self.target_language)
                 except Exception as e:
-                    self.logger.error(f'Error in batch analysis: {str(e)}')
-                    results.append((0.0, 'unknown'))
+                    self.logger.error(f'Batch translation error: {str(e)}')
+                    for i in indices:
+                        results[i] = (0.0, lang)
+                    continue
+
+            for i, text in zip(indices, group_texts):
+                results[i] = (self._get_sentiment(text), lang)
+
         return results
+
+    def analyze_batch(self, texts: List[str]) -> List[Tuple[float, str]]:
+        """Пакетный анализ тональности с сохранением порядка"""
+        if not texts:
+            return []
+
+        try:
+            return self.analyze_texts(texts)
+        except Exception as e:
+            self.logger.error(f'Error in batch analysis: {str(e)}')
+            return [(0.0, 'unknown')] * len(texts)
         
     def get_sentiment_stats(self, texts: List[str]) -> Dict[str, float]:
         """Получение статистики по тональности"""
@@ -138,13 +334,11 @@ class SentimentAnalyzer:
         """Получение распределения по языкам"""
         if not texts:
             return {}
-            
-        language_counts = defaultdict(int)
-        for text in texts:
-            if text and isinstance(text, str):
-                lang = self._detect_language(text)
-                language_counts[lang] += 1
-        return dict(language_counts)
+
+        languages = self._detect_language_batch(
+            [text for text in texts if text and isinstance(text, str)]
+        )
+        return dict(Counter(languages))
         
     def get_sentiment_label(self, sentiment: float) -> str:
         """Получение текстовой метки тональности"""
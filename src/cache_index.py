@@ -0,0 +1,78 @@
+import logging
+import os
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def hash_digest(hash_hex: str) -> int:
+    """64-битный дайджест из hex-хэша отзыва"""
+    return int(hash_hex[:16], 16)
+
+class HashIndex:
+    """Сортированный индекс 64-битных дайджестов для дедупликации
+
+    Дайджесты хранятся в отдельном бинарном файле как отсортированный
+    массив uint64. Проверка дубликата — бинарный поиск по непрерывному
+    массиву вместо обхода записей кэша; при наличии numpy загрузка и
+    поиск выполняются на уровне C.
+    """
+
+    def __init__(self, index_file: str = 'reviews_cache.hashes.bin'):
+        self.logger = logging.getLogger(__name__)
+        self.index_file = Path(index_file)
+        self.loaded = False
+        self._digests = array('Q')
+        self._pending = set()
+        self._load()
+
+    def _load(self) -> None:
+        """Загрузка индекса из файла"""
+        if not self.index_file.exists():
+            return
+
+        try:
+            if np is not None:
+                self._digests = array('Q', np.fromfile(self.index_file, dtype=np.uint64))
+            else:
+                self._digests = array('Q')
+                with open(self.index_file, 'rb') as f:
+                    self._digests.frombytes(f.read())
+            self.loaded = True
+        except Exception as e:
+            self.logger.error(f'Error loading hash index: {str(e)}')
+            self._digests = array('Q')
+
+    def seed(self, hashes: Iterable[str]) -> None:
+        """Построение индекса из hex-хэшей существующего кэша"""
+        self._digests = array('Q', sorted(hash_digest(h) for h in hashes))
+
+    def __contains__(self, hash_hex: str) -> bool:
+        digest = hash_digest(hash_hex)
+        if digest in self._pending:
+            return True
+        pos = bisect_left(self._digests, digest)
+        return pos < len(self._digests) and self._digests[pos] == digest
+
+    def add(self, hash_hex: str) -> None:
+        """Регистрация нового хэша в индексе"""
+        self._pending.add(hash_digest(hash_hex))
+
+    def save(self) -> None:
+        """Атомарное сохранение индекса на диск"""
+        try:
+            if self._pending:
+                self._digests = array('Q', sorted(self._digests + array('Q', self._pending)))
+                self._pending.clear()
+
+            tmp_path = self.index_file.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(self._digests.tobytes())
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            self.logger.error(f'Error saving hash index: {str(e)}')
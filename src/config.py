@@ -1,6 +1,14 @@
 import json
 import os
+import pickle
+import pprint
+import importlib.util
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -38,7 +46,9 @@ class AnalyzerConfig:
 @dataclass
 class NotifierConfig:
     """Конфигурация уведомлений"""
-    enabled: bool = True
+    # Выключено по умолчанию: валидатор требует telegram_token и chat_id
+    # при включенных уведомлениях, а дефолт не может их знать
+    enabled: bool = False
     telegram_token: str = ''
     chat_id: str = ''
     notify_on_negative: bool = True
@@ -83,6 +93,7 @@ class ConfigManager:
     
     def __init__(self, config_path: str = 'config.json'):
         self.config_path = Path(config_path)
+        self.cache_path = Path(f'{config_path}.cache')
         self.parser_config = ParserConfig()
         self.analyzer_config = AnalyzerConfig()
         self.notifier_config = NotifierConfig()
@@ -94,17 +105,37 @@ class ConfigManager:
         """Загружает конфигурацию из файла"""
         try:
             if not self.config_path.exists():
+                # Сначала пробуем готовый Python-модуль с дефолтами:
+                # импорт литерала дешевле разбора и валидации JSON
+                defaults = self._load_default_module()
+                if defaults is not None:
+                    self._update_configs(defaults)
+                    logging.info('Использована конфигурация по умолчанию из config_default.py')
+                    return defaults
+
                 self._create_default_config()
-                
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
+
+            stat = self.config_path.stat()
+
+            # Сначала пробуем загрузить уже проверенную конфигурацию из кэша
+            config = self._load_cached_config(stat)
+            if config is not None:
+                logging.info('Конфигурация загружена из кэша')
+                return config
+
+            if orjson is not None:
+                config = orjson.loads(self.config_path.read_bytes())
+            else:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+
             self._validate_config(config)
             self._update_configs(config)
-            
+            self._save_cached_config(stat, config)
+
             logging.info('Конфигурация успешно загружена')
             return config
-            
+
         except Exception as e:
             log_error(logging.getLogger(__name__), 'Ошибка загрузки конфигурации', e)
             raise
@@ -119,9 +150,13 @@ class ConfigManager:
                 backup_path = self.config_path.with_suffix(f'.{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
                 self.config_path.rename(backup_path)
                 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
-                
+            if orjson is not None:
+                self.config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_path, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=4, ensure_ascii=False)
+
+
             self._update_configs(config)
             logging.info('Конфигурация успешно сохранена')
             
@@ -129,6 +164,88 @@ class ConfigManager:
             log_error(logging.getLogger(__name__), 'Ошибка сохранения конфигурации', e)
             raise
             
+    def _load_cached_config(self, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Загружает валидированную конфигурацию из pickle-кэша
+
+        Кэш считается актуальным, если mtime и размер config.json не
+        изменились с момента его записи. При попадании пропускаются
+        json.load, валидация и пересоздание дата-классов.
+        """
+        if not self.cache_path.exists():
+            return None
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = pickle.load(f)
+
+            if cached.get('mtime_ns') != stat.st_mtime_ns or cached.get('size') != stat.st_size:
+                return None
+
+            self.parser_config = cached['parser_config']
+            self.analyzer_config = cached['analyzer_config']
+            self.notifier_config = cached['notifier_config']
+            self.cache_config = cached['cache_config']
+            self.logging_config = cached['logging_config']
+            self.security_config = cached['security_config']
+            return cached['config']
+
+        except Exception as e:
+            logging.warning(f'Не удалось прочитать кэш конфигурации: {str(e)}')
+            return None
+
+    def _save_cached_config(self, stat: os.stat_result, config: Dict[str, Any]) -> None:
+        """Сохраняет валидированную конфигурацию в pickle-кэш"""
+        try:
+            payload = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'config': config,
+                'parser_config': self.parser_config,
+                'analyzer_config': self.analyzer_config,
+                'notifier_config': self.notifier_config,
+                'cache_config': self.cache_config,
+                'logging_config': self.logging_config,
+                'security_config': self.security_config
+            }
+
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+
+        except Exception as e:
+            logging.warning(f'Не удалось сохранить кэш конфигурации: {str(e)}')
+
+    def _load_default_module(self) -> Optional[Dict[str, Any]]:
+        """Загружает конфигурацию по умолчанию из config_default.py
+
+        Модуль генерируется после успешного сохранения (и, значит,
+        валидации) дефолтной конфигурации, поэтому повторный JSON-разбор
+        и валидация при загрузке не нужны.
+        """
+        module_path = self.config_path.with_name('config_default.py')
+        if not module_path.exists():
+            return None
+
+        try:
+            spec = importlib.util.spec_from_file_location('config_default', module_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.DEFAULTS
+        except Exception as e:
+            logging.warning(f'Не удалось загрузить config_default.py: {str(e)}')
+            return None
+
+    def _write_default_module(self, default_config: Dict[str, Any]) -> None:
+        """Сохраняет конфигурацию по умолчанию как Python-модуль"""
+        try:
+            module_path = self.config_path.with_name('config_default.py')
+            with open(module_path, 'w', encoding='utf-8') as f:
+                f.write('"""Конфигурация по умолчанию (генерируется автоматически)"""\n\n')
+                f.write(f'DEFAULTS = {pprint.pformat(default_config, sort_dicts=False)}\n')
+        except Exception as e:
+            logging.warning(f'Не удалось сохранить config_default.py: {str(e)}')
+
     def _create_default_config(self) -> None:
         """Создает конфигурацию по умолчанию"""
         default_config = {
@@ -181,7 +298,12 @@ class ConfigManager:
             }
         }
         
+        # Модуль с дефолтами пишется только после успешного сохранения:
+        # save_config валидирует конфигурацию, и упавшая валидация не
+        # должна оставлять после себя config_default.py, который при
+        # следующем запуске вернул бы непроверенные значения
         self.save_config(default_config)
+        self._write_default_module(default_config)
         
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """Валидирует конфигурацию"""
@@ -1,18 +1,134 @@
+import atexit
 import logging
 import logging.handlers
 import json
 import os
-from datetime import datetime
+import queue
+import threading
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Параметры пакетной записи логов: записи копятся в пользовательском
+# буфере и уходят в файл одним write на буфер, что сокращает число
+# enter-сисколлов пропорционально размеру буфера
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 0.2
+
+# Фоновый слушатель очереди логов (живет до завершения процесса)
+# и обслуживаемые им обработчики
+_queue_listener = None
+_queue_handlers = []
+
+def _stop_queue_listener() -> None:
+    """Останавливает слушатель очереди логов и закрывает его обработчики"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    # Без close() буферизованные обработчики продолжали бы держать
+    # дескрипторы файлов и перепланировать таймеры сброса
+    for handler in _queue_handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+    _queue_handlers.clear()
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler для внутрипроцессной очереди логов
+
+    Стандартный prepare() заранее форматирует запись и обнуляет
+    exc_info, из-за чего StructuredLogFormatter терял поле exception.
+    Очередь SimpleQueue живет в том же процессе и не требует
+    сериализации, поэтому запись передается слушателю как есть.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler с буферизованной записью
+
+    Записи копятся в буфере вместо write-сисколла на каждую строку:
+    буфер сбрасывается при заполнении, по таймеру, при ротации и
+    немедленно для записей уровня ERROR и выше.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
+                 encoding=None, buffer_size=_LOG_BUFFER_SIZE,
+                 flush_interval=_LOG_FLUSH_INTERVAL):
+        self.buffer_size = buffer_size
+        super().__init__(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding
+        )
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+        self._closed = False
+        self._schedule_flush()
+
+    def _open(self):
+        """Открывает файл с укрупненным буфером записи"""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding or 'utf-8'
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Пишет запись в буфер; сброс на диск — только для ошибок"""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def _schedule_flush(self) -> None:
+        """Планирует периодический сброс буфера"""
+        timer = threading.Timer(self.flush_interval, self._periodic_flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _periodic_flush(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        except Exception:
+            pass
+        self._schedule_flush()
+
+    def close(self) -> None:
+        self._closed = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        super().close()
+
 class StructuredLogFormatter(logging.Formatter):
     """Форматтер для структурированного логирования в JSON"""
     
     def format(self, record: logging.LogRecord) -> str:
         """Форматирует запись лога в JSON"""
+        # Секунды эпохи с микросекундами: форматирование без аллокации
+        # объекта datetime и резолвинга tzinfo на каждую запись
+        ts = record.created
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': f'{int(ts)}.{int(ts % 1 * 1e6):06d}',
             'level': record.levelname,
             'message': record.getMessage(),
             'module': record.module,
@@ -32,6 +148,8 @@ class StructuredLogFormatter(logging.Formatter):
                 'traceback': self.formatException(record.exc_info)
             }
             
+        if orjson is not None:
+            return orjson.dumps(log_data).decode('utf-8')
         return json.dumps(log_data, ensure_ascii=False)
 
 def setup_logging(
@@ -56,56 +174,53 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Очищаем существующие обработчики
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    # Очищаем существующие обработчики одной операцией
+    root_logger.handlers.clear()
     
-    # Создаем обработчики для разных уровней логирования
+    # Один файл на все уровни: уровень записи уже есть в JSON-поле
+    # level, поэтому раздельные debug/info/error файлы лишь утраивали
+    # дескрипторы, блокировки и пути ротации
     handlers = {
-        'debug': logging.handlers.RotatingFileHandler(
-            log_path / 'debug.log',
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding='utf-8'
-        ),
-        'info': logging.handlers.RotatingFileHandler(
-            log_path / 'info.log',
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding='utf-8'
-        ),
-        'error': logging.handlers.RotatingFileHandler(
-            log_path / 'error.log',
+        'file': BufferedRotatingFileHandler(
+            log_path / 'app.log',
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding='utf-8'
         ),
         'console': logging.StreamHandler()
     }
-    
+
     # Настраиваем форматтеры
     json_formatter = StructuredLogFormatter()
     console_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     # Устанавливаем уровни и форматтеры для обработчиков
-    handlers['debug'].setLevel(logging.DEBUG)
-    handlers['debug'].setFormatter(json_formatter)
-    
-    handlers['info'].setLevel(logging.INFO)
-    handlers['info'].setFormatter(json_formatter)
-    
-    handlers['error'].setLevel(logging.ERROR)
-    handlers['error'].setFormatter(json_formatter)
-    
+    handlers['file'].setLevel(logging.DEBUG)
+    handlers['file'].setFormatter(json_formatter)
+
     handlers['console'].setLevel(logging.INFO)
     handlers['console'].setFormatter(console_formatter)
     
-    # Добавляем обработчики к корневому логгеру
-    for handler in handlers.values():
-        root_logger.addHandler(handler)
-    
+    # Пишущие обработчики уводим за очередь: вызывающий поток только
+    # кладет запись в очередь, файловый ввод-вывод выполняет фоновый
+    # поток слушателя
+    global _queue_listener
+    _stop_queue_listener()
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_PassthroughQueueHandler(log_queue))
+
+    _queue_handlers.extend(handlers.values())
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers.values(),
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_stop_queue_listener)
+
     # Логируем информацию о запуске
     logging.info('Логирование настроено', extra={
         'log_dir': str(log_path),
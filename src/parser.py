@@ -1,4 +1,5 @@
 import logging
+import re
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -8,9 +9,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    WebDriverException,
-    NoSuchElementException,
-    StaleElementReferenceException
+    WebDriverException
 )
 from bs4 import BeautifulSoup
 import json
@@ -18,10 +17,20 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import time
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
 import atexit
 
+# C-парсер lxml заметно быстрее встроенного html.parser, но является
+# опциональной зависимостью
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# Скомпилированный паттерн извлечения оценки из aria-label
+# вида "Rating 4.0"
+_RATING_RE = re.compile(r'Rating\s+([\d.]+)')
+
 @dataclass
 class Review:
     text: str
@@ -100,28 +109,32 @@ class ReviewParser:
                 self._driver = None
                 self._wait = None
                 
-    @lru_cache(maxsize=100)
-    def _get_element_text(self, element, selector: str) -> Optional[str]:
-        """Получение текста элемента с кэшированием"""
-        try:
-            return element.find_element(By.CSS_SELECTOR, selector).text.strip()
-        except NoSuchElementException:
-            return None
-        except StaleElementReferenceException:
-            self.logger.warning(f'Stale element reference for selector: {selector}')
+    @staticmethod
+    def _get_element_text(element, selector: str) -> Optional[str]:
+        """Получение текста вложенного элемента по CSS-селектору"""
+        found = element.select_one(selector)
+        if found is None:
             return None
-            
+        return found.get_text().strip()
+
     def _parse_review_element(self, element) -> Optional[Review]:
-        """Парсинг отдельного отзыва с обработкой ошибок"""
+        """Парсинг отдельного отзыва (bs4 Tag) с обработкой ошибок"""
         try:
             text = self._get_element_text(element, '.review-text')
             if not text:
                 return None
-                
+
             rating_text = self._get_element_text(element, '.rating')
+            if not rating_text:
+                # Fallback: оценка в aria-label вида "Rating 4.0"
+                rated = element.select_one('[aria-label*="Rating"]')
+                if rated is not None:
+                    match = _RATING_RE.search(rated.get('aria-label', ''))
+                    if match:
+                        rating_text = match.group(1)
             if not rating_text:
                 return None
-                
+
             try:
                 rating = float(rating_text.split()[0])
                 if not 0 <= rating <= 5:
@@ -129,38 +142,47 @@ class ReviewParser:
                     return None
             except (ValueError, IndexError):
                 return None
-                
+
             author = self._get_element_text(element, '.author-name') or 'Anonymous'
             date = self._get_element_text(element, '.review-date') or datetime.now().strftime('%Y-%m-%d')
-            
+
             return Review(text=text, rating=rating, author=author, date=date)
-        except StaleElementReferenceException:
-            self.logger.warning('Stale element reference while parsing review')
-            return None
         except Exception as e:
             self.logger.error(f'Error parsing review element: {str(e)}')
             return None
-            
+
+    def _parse_soup(self, soup) -> List[Review]:
+        """Разбор отзывов из готового дерева BeautifulSoup
+
+        Выделено из _load_reviews: тесты могут передавать заранее
+        разобранный soup, не оплачивая повторный парсинг HTML.
+        """
+        review_elements = soup.select('.review-container')
+
+        if not review_elements:
+            self.logger.warning('No reviews found on the page')
+            return []
+
+        return list(filter(None, map(self._parse_review_element, review_elements)))
+
     def _load_reviews(self, url: str) -> List[Review]:
-        """Загрузка и парсинг отзывов с использованием многопоточности"""
+        """Загрузка страницы и разбор отзывов одним проходом
+
+        Вместо четырех RPC-вызовов find_element на каждый отзыв
+        страница забирается целиком через page_source и разбирается
+        BeautifulSoup локально, без обращений к ChromeDriver.
+        """
         try:
             self.driver.get(url)
             time.sleep(2)  # Даем время для загрузки динамического контента
-            
+
             # Ждем загрузки отзывов
-            review_elements = self.wait.until(
+            self.wait.until(
                 EC.presence_of_all_elements_located((By.CSS_SELECTOR, '.review-container'))
             )
-            
-            if not review_elements:
-                self.logger.warning('No reviews found on the page')
-                return []
-            
-            # Парсим отзывы в нескольких потоках
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                reviews = list(filter(None, executor.map(self._parse_review_element, review_elements)))
-                
-            return reviews
+
+            soup = BeautifulSoup(self.driver.page_source, _SOUP_PARSER)
+            return self._parse_soup(soup)
         except TimeoutException:
             raise NetworkError('Timeout while loading reviews')
         except WebDriverException as e:
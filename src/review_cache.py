@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any, List
+
+@dataclass
+class ReviewCache:
+    """Колоночное хранилище кэша отзывов (SoA вместо списка словарей)
+
+    Каждое поле отзыва лежит в отдельном списке, поэтому статистика по
+    одной колонке (средняя тональность, набор языков) — это проход по
+    непрерывному списку значений без обхода словарей.
+    """
+    texts: List[str] = field(default_factory=list)
+    hashes: List[str] = field(default_factory=list)
+    sentiments: List[float] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+    ratings: List[float] = field(default_factory=list)
+    authors: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    # Количество записей, уже сохраненных на диск (для дозаписи)
+    persisted_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def append(self, text: str, hash_hex: str, sentiment: float, language: str,
+               rating: float, author: str, date: str) -> None:
+        """Добавление отзыва в кэш"""
+        self.texts.append(text)
+        self.hashes.append(hash_hex)
+        self.sentiments.append(sentiment)
+        self.languages.append(language)
+        self.ratings.append(rating)
+        self.authors.append(author)
+        self.dates.append(date)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'ReviewCache':
+        """Построение кэша из списка словарей (формат на диске)"""
+        cache = cls()
+        for record in records:
+            cache.append(
+                text=record.get('text', ''),
+                hash_hex=record.get('hash', ''),
+                sentiment=record.get('sentiment', 0.0),
+                language=record.get('language', 'unknown'),
+                rating=record.get('rating', 0.0),
+                author=record.get('author', ''),
+                date=record.get('date', '')
+            )
+        return cache
+
+    def to_records(self, start: int = 0) -> List[Dict[str, Any]]:
+        """Выгрузка кэша в список словарей начиная с записи start"""
+        return [
+            {
+                'text': text,
+                'hash': hash_hex,
+                'sentiment': sentiment,
+                'language': language,
+                'rating': rating,
+                'author': author,
+                'date': date
+            }
+            for text, hash_hex, sentiment, language, rating, author, date in zip(
+                self.texts[start:], self.hashes[start:], self.sentiments[start:],
+                self.languages[start:], self.ratings[start:], self.authors[start:],
+                self.dates[start:]
+            )
+        ]
@@ -6,12 +6,33 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 import secrets
-import string
+from functools import lru_cache
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.cache_index import HashIndex
+
+# Скомпилированные паттерны валидации и очистки текста
+_URL_RE = re.compile(
+    r'^https?://'  # http:// или https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # домен
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+    r'(?::\d+)?'  # порт
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+_TG_TOKEN_RE = re.compile(r'^\d+:[A-Za-z0-9_-]{35}$')
+_CHAT_ID_RE = re.compile(r'^-?\d+$')
+# HTML-теги и небезопасные символы вырезаются одной альтернацией —
+# один проход по строке вместо двух последовательных re.sub
+_SANITIZE_RE = re.compile(r'<[^>]+>|[^\w\s.,!?-]')
+
 class SecurityError(Exception):
     """Базовый класс для ошибок безопасности"""
     pass
@@ -29,6 +50,29 @@ class SecurityManager:
         self.logger = logging.getLogger(__name__)
         self.key_file = Path(key_file)
         self.fernet = self._initialize_encryption()
+        self._hash_index = None
+
+    @property
+    def hash_index(self) -> HashIndex:
+        """Индекс хэшей обработанных отзывов (ленивая инициализация)"""
+        if self._hash_index is None:
+            self._hash_index = HashIndex()
+        return self._hash_index
+
+    def is_duplicate(self, text: str) -> bool:
+        """Проверка, был ли отзыв с таким текстом уже обработан"""
+        return self.hash_data(text) in self.hash_index
+
+    def register_review(self, text: str) -> str:
+        """Регистрация отзыва в индексе; возвращает его хэш"""
+        review_hash = self.hash_data(text)
+        self.hash_index.add(review_hash)
+        return review_hash
+
+    def save_hash_index(self) -> None:
+        """Сохранение индекса хэшей на диск"""
+        if self._hash_index is not None:
+            self._hash_index.save()
         
     def _initialize_encryption(self) -> Fernet:
         """Инициализация шифрования"""
@@ -60,49 +104,82 @@ class SecurityManager:
         except Exception as e:
             self.logger.error(f'Error decrypting data: {str(e)}')
             raise EncryptionError('Failed to decrypt data')
+
+    def encrypt_many(self, items: list) -> list:
+        """Пакетное шифрование списка строк
+
+        Криптографический контекст и привязка метода encrypt
+        разрешаются один раз на пачку, а не на каждую запись.
+        """
+        encrypt = self.fernet.encrypt
+        try:
+            return [encrypt(item.encode()).decode() for item in items]
+        except Exception as e:
+            self.logger.error(f'Error encrypting batch: {str(e)}')
+            raise EncryptionError('Failed to encrypt batch')
+
+    def decrypt_many(self, items: list) -> list:
+        """Пакетное дешифрование списка строк"""
+        decrypt = self.fernet.decrypt
+        try:
+            return [decrypt(item.encode()).decode() for item in items]
+        except Exception as e:
+            self.logger.error(f'Error decrypting batch: {str(e)}')
+            raise EncryptionError('Failed to decrypt batch')
             
     @staticmethod
     def generate_secure_token(length: int = 32) -> str:
-        """Генерация безопасного токена"""
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        """Генерация безопасного токена
+
+        Токен берется одним обращением к системному ГСЧ через
+        secrets.token_urlsafe вместо посимвольного цикла secrets.choice.
+        Алфавит — URL-safe base64 (буквы, цифры, '-' и '_').
+        """
+        return secrets.token_urlsafe(length)[:length]
         
     @staticmethod
+    @lru_cache(maxsize=8192)
     def hash_data(data: str) -> str:
-        """Хеширование данных"""
+        """Хеширование данных с мемоизацией повторных вызовов"""
         return hashlib.sha256(data.encode()).hexdigest()
+
+    @staticmethod
+    def hash_many(texts: list) -> list:
+        """Пакетное хеширование текстов
+
+        Для некриптографической дедупликации используется blake2b
+        (256 бит): он заметно быстрее sha256 на коротких строках.
+        Для вызовов, которым нужна именно семантика SHA-256,
+        остается hash_data.
+        """
+        blake2b = hashlib.blake2b
+        out = []
+        for text in texts:
+            h = blake2b(digest_size=32)
+            h.update(text.encode())
+            out.append(h.hexdigest())
+        return out
         
     @staticmethod
     def validate_url(url: str) -> bool:
         """Валидация URL"""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// или https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # домен
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # порт
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(url_pattern.match(url))
+        return bool(_URL_RE.match(url))
         
     @staticmethod
     def validate_telegram_token(token: str) -> bool:
         """Валидация токена Telegram"""
-        token_pattern = re.compile(r'^\d+:[A-Za-z0-9_-]{35}$')
-        return bool(token_pattern.match(token))
+        return bool(_TG_TOKEN_RE.match(token))
         
     @staticmethod
     def validate_chat_id(chat_id: str) -> bool:
         """Валидация ID чата Telegram"""
-        return chat_id.isdigit() or (chat_id.startswith('-') and chat_id[1:].isdigit())
+        return bool(chat_id and _CHAT_ID_RE.match(chat_id))
         
     @staticmethod
     def sanitize_text(text: str) -> str:
         """Очистка текста от потенциально опасных символов"""
-        # Удаляем HTML теги
-        text = re.sub(r'<[^>]+>', '', text)
-        # Удаляем специальные символы
-        text = re.sub(r'[^\w\s.,!?-]', '', text)
-        return text.strip()
+        # Удаляем HTML теги и специальные символы одним проходом
+        return _SANITIZE_RE.sub('', text).strip()
         
     def secure_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Безопасное хранение конфигурации"""
@@ -117,13 +194,16 @@ class SecurityManager:
     def load_secure_config(self, config_path: str) -> Dict[str, Any]:
         """Загрузка зашифрованной конфигурации"""
         try:
-            with open(config_path) as f:
-                config = json.load(f)
-                
+            data = Path(config_path).read_bytes()
+            if orjson is not None:
+                config = orjson.loads(data)
+            else:
+                config = json.loads(data.decode('utf-8'))
+
             # Расшифровываем чувствительные данные
             if 'telegram_token' in config:
                 config['telegram_token'] = self.decrypt_data(config['telegram_token'])
-                
+
             return config
         except Exception as e:
             self.logger.error(f'Error loading secure config: {str(e)}')
@@ -133,12 +213,81 @@ class SecurityManager:
         """Сохранение конфигурации в зашифрованном виде"""
         try:
             secure_config = self.secure_config(config)
-            with open(config_path, 'w') as f:
-                json.dump(secure_config, f, indent=2)
+            # Компактная сериализация без отступов: файл машинный,
+            # человеку его читать не предполагается
+            if orjson is not None:
+                data = orjson.dumps(secure_config)
+            else:
+                data = json.dumps(secure_config, ensure_ascii=False).encode('utf-8')
+            Path(config_path).write_bytes(data)
         except Exception as e:
             self.logger.error(f'Error saving secure config: {str(e)}')
             raise SecurityError('Failed to save secure configuration')
             
+    def load_secure_cache(self, cache_path: str) -> list:
+        """Загрузка кэша отзывов
+
+        Основной формат — JSONL (одна запись на строку), разбираемый
+        потоково. Старый формат (один JSON-массив) распознается по
+        содержимому и читается целиком для миграции.
+        """
+        path = Path(cache_path)
+        if not path.exists():
+            # Миграция: пробуем старый файл с JSON-массивом
+            legacy_path = path.with_suffix('.json')
+            if legacy_path != path and legacy_path.exists():
+                path = legacy_path
+            else:
+                return []
+
+        try:
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(path, 'rb') as f:
+                first = f.read(1)
+                if not first.strip():
+                    return []
+                f.seek(0)
+
+                if first == b'[':
+                    # Старый формат: один JSON-массив
+                    records = loads(f.read())
+                else:
+                    # JSONL читается построчно из файлового объекта, без
+                    # промежуточной копии всего файла в памяти
+                    records = [loads(line) for line in f if line.strip()]
+
+            # Строим индекс дедупликации, если сайдкар еще не создан
+            if not self.hash_index.loaded:
+                self.hash_index.seed(
+                    record['hash'] for record in records if record.get('hash')
+                )
+
+            return records
+        except Exception as e:
+            self.logger.error(f'Error loading secure cache: {str(e)}')
+            raise SecurityError('Failed to load secure cache')
+
+    def append_secure_cache(self, cache_path: str, records: list) -> None:
+        """Дозапись новых записей кэша в JSONL-файл
+
+        Пишутся только переданные записи, без пересериализации всего
+        кэша, поэтому стоимость сохранения пропорциональна количеству
+        новых отзывов, а не размеру кэша.
+        """
+        if not records:
+            return
+
+        try:
+            with open(cache_path, 'ab') as f:
+                for record in records:
+                    if orjson is not None:
+                        f.write(orjson.dumps(record) + b'\n')
+                    else:
+                        f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        except Exception as e:
+            self.logger.error(f'Error appending secure cache: {str(e)}')
+            raise SecurityError('Failed to append secure cache')
+
     def validate_review(self, review: Dict[str, Any]) -> bool:
         """Валидация данных отзыва"""
         try:
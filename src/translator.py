@@ -1,10 +1,49 @@
+import atexit
 import logging
-from typing import Optional, Dict
+import os
+import threading
+from typing import Optional, Dict, List
 import json
 from pathlib import Path
 from googletrans import Translator
 from functools import lru_cache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Интервал фонового сброса кэша переводов на диск
+_FLUSH_INTERVAL = 5.0
+
+# Порог уверенности локального детектора языка; ниже него решение
+# делегируется сетевому detect googletrans
+_DETECT_CONFIDENCE = 0.7
+
+# Лениво загружаемый langdetect (см. аналогичный паттерн в analyzer)
+_langdetect = None
+
+def _detect_language_local(text: str) -> Optional[str]:
+    """Локальное определение языка без сетевого вызова
+
+    Возвращает код языка либо None, если детектор недоступен или
+    не уверен в результате.
+    """
+    global _langdetect
+    if _langdetect is None:
+        try:
+            import langdetect
+            _langdetect = langdetect
+        except ImportError:
+            _langdetect = False
+    if not _langdetect:
+        return None
+    try:
+        top = _langdetect.detect_langs(text)[0]
+        return top.lang if top.prob >= _DETECT_CONFIDENCE else None
+    except Exception:
+        return None
+
 class TranslationError(Exception):
     """Ошибка при переводе текста"""
     pass
@@ -13,37 +52,111 @@ class TranslationCache:
     def __init__(self, cache_file: str = 'translation_cache.json'):
         self.logger = logging.getLogger(__name__)
         self.cache_file = Path(cache_file)
-        self.cache: Dict[str, Dict[str, str]] = self._load_cache()
-        
-    def _load_cache(self) -> Dict[str, Dict[str, str]]:
-        """Загрузка кэша переводов из файла"""
+        self.cache: Dict[tuple, str] = self._load_cache()
+        # Запись на диск отложенная: новые переводы только помечают кэш
+        # грязным, а файл переписывается фоновым таймером или при выходе
+        self._dirty = False
+        self._closed = False
+        self._flush_timer = None
+        self._schedule_flush()
+        atexit.register(self.close)
+
+    def _load_cache(self) -> Dict[tuple, str]:
+        """Загрузка кэша переводов из файла
+
+        В памяти кэш плоский: один dict с ключом (текст, язык) вместо
+        словаря словарей — одна выборка вместо двух на обращение. На
+        диске хранится список записей {'t': текст, 'l': язык, 'r':
+        перевод}; старый вложенный формат распознается и мигрируется.
+        """
         if self.cache_file.exists():
             try:
-                with open(self.cache_file) as f:
-                    return json.load(f)
+                raw = self.cache_file.read_bytes()
+                if orjson is not None:
+                    data = orjson.loads(raw)
+                else:
+                    data = json.loads(raw.decode('utf-8'))
+
+                if isinstance(data, dict):
+                    # Миграция старого вложенного формата
+                    return {
+                        (text, lang): translation
+                        for text, translations in data.items()
+                        for lang, translation in translations.items()
+                    }
+                return {(r['t'], r['l']): r['r'] for r in data}
             except Exception as e:
                 self.logger.error(f'Error loading translation cache: {str(e)}')
                 return {}
         return {}
-    
+
     def _save_cache(self):
-        """Сохранение кэша переводов в файл"""
+        """Атомарное сохранение кэша переводов в файл"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            records = [
+                {'t': text, 'l': lang, 'r': translation}
+                for (text, lang), translation in self.cache.items()
+            ]
+            # Компактная сериализация без отступов: файл машинный
+            if orjson is not None:
+                data = orjson.dumps(records)
+            else:
+                data = json.dumps(records, ensure_ascii=False).encode('utf-8')
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
             self.logger.error(f'Error saving translation cache: {str(e)}')
-    
+
+    def _schedule_flush(self):
+        """Планирует периодический сброс кэша на диск"""
+        timer = threading.Timer(_FLUSH_INTERVAL, self._periodic_flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _periodic_flush(self):
+        if self._closed:
+            return
+        self.flush()
+        self._schedule_flush()
+
+    def flush(self):
+        """Сбрасывает накопленные переводы на диск, если они есть"""
+        if self._dirty:
+            self._save_cache()
+            self._dirty = False
+
+    def close(self):
+        """Останавливает фоновый таймер и дописывает остаток на диск"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self.flush()
+
     def get_cached_translation(self, text: str, target_lang: str) -> Optional[str]:
         """Получение перевода из кэша"""
-        return self.cache.get(text, {}).get(target_lang)
-    
+        return self.cache.get((text, target_lang))
+
     def cache_translation(self, text: str, target_lang: str, translation: str):
         """Сохранение перевода в кэш"""
-        if text not in self.cache:
-            self.cache[text] = {}
-        self.cache[text][target_lang] = translation
-        self._save_cache()
+        self.cache[(text, target_lang)] = translation
+        self._dirty = True
+
+    def cache_translations(self, entries: List[tuple], target_lang: str):
+        """Сохранение пачки переводов в кэш
+
+        Args:
+            entries: Список пар (исходный текст, перевод)
+            target_lang: Целевой язык переводов
+        """
+        if not entries:
+            return
+        for text, translation in entries:
+            self.cache[(text, target_lang)] = translation
+        self._dirty = True
 
 class TextTranslator:
     def __init__(self, cache_file: str = 'translation_cache.json'):
@@ -75,11 +188,14 @@ class TextTranslator:
             return cached
             
         try:
-            # Определяем язык исходного текста
-            detected = self.translator.detect(text)
-            
+            # Определяем язык исходного текста локально; сетевой detect
+            # остается только как fallback при неуверенном результате
+            detected_lang = _detect_language_local(text)
+            if detected_lang is None:
+                detected_lang = self.translator.detect(text).lang
+
             # Если язык уже целевой, возвращаем исходный текст
-            if detected.lang == target_lang:
+            if detected_lang == target_lang:
                 self.cache.cache_translation(text, target_lang, text)
                 return text
                 
@@ -95,6 +211,55 @@ class TextTranslator:
             self.logger.error(f'Translation error: {str(e)}')
             raise TranslationError(f'Failed to translate text: {str(e)}')
             
+    def translate_batch(self, texts: List[str], target_lang: str = 'en') -> List[str]:
+        """
+        Пакетный перевод текстов с использованием кэша
+
+        Args:
+            texts: Список текстов для перевода
+            target_lang: Целевой язык (по умолчанию английский)
+
+        Returns:
+            List[str]: Переведенные тексты в исходном порядке
+        """
+        if not texts:
+            return []
+
+        results: List[Optional[str]] = [None] * len(texts)
+
+        # Сначала забираем всё, что уже есть в кэше
+        miss_indices: List[int] = []
+        for i, text in enumerate(texts):
+            if not text:
+                results[i] = text
+                continue
+            cached = self.cache.get_cached_translation(text, target_lang)
+            if cached:
+                results[i] = cached
+            else:
+                miss_indices.append(i)
+
+        if not miss_indices:
+            return results
+
+        # Промахи переводим одним batch-запросом: googletrans принимает
+        # список текстов, так что N HTTP-запросов схлопываются в один
+        miss_texts = [texts[i] for i in miss_indices]
+        try:
+            translated = self.translator.translate(miss_texts, dest=target_lang)
+            entries = []
+            for i, item in zip(miss_indices, translated):
+                results[i] = item.text
+                entries.append((texts[i], item.text))
+            # Кэш пополняется всей пачкой с одной записью на диск
+            self.cache.cache_translations(entries, target_lang)
+        except Exception as e:
+            self.logger.error(f'Batch translation error: {str(e)}')
+            for i in miss_indices:
+                results[i] = texts[i]  # Возвращаем исходный текст при ошибке
+
+        return results
+
     def translate_review(self, review_text: str, target_lang: str = 'en') -> str:
         """
         Перевод отзыва с обработкой ошибок
@@ -0,0 +1,34 @@
+import pytest
+from unittest.mock import create_autospec
+from src.security import SecurityManager
+
+@pytest.fixture(scope="session")
+def _security_manager_mock():
+    """Mock менеджера безопасности, создаваемый один раз на сессию
+
+    create_autospec обходит все атрибуты класса при построении; делаем
+    это один раз на сессию, а не в каждом тесте, и заодно получаем
+    проверку сигнатур вызовов.
+    """
+    return create_autospec(SecurityManager, instance=True)
+
+@pytest.fixture
+def mock_security_manager(_security_manager_mock):
+    """Сброшенный к дефолтному состоянию mock менеджера безопасности"""
+    manager = _security_manager_mock
+    manager.reset_mock(return_value=True, side_effect=True)
+    manager.validate_url.return_value = True
+    manager.validate_telegram_token.return_value = True
+    manager.validate_chat_id.return_value = True
+    manager.validate_review.return_value = True
+    manager.sanitize_text.side_effect = lambda x: x
+    manager.hash_data.side_effect = lambda x: f"hashed_{x}"
+    return manager
+
+@pytest.fixture(scope="session")
+def valid_config():
+    return {
+        'google_maps_url': 'https://maps.google.com/place',
+        'telegram_token': '123456:ABC-DEF1234ghIkl-zyx57W2v1u123ew11',
+        'chat_id': '123456789'
+    }
@@ -2,6 +2,7 @@ import pytest
 import json
 import os
 from pathlib import Path
+
 from src.parser import ReviewParser, Review
 from src.analyzer import SentimentAnalyzer
 from src.translator import TextTranslator
@@ -9,11 +10,25 @@ from src.security import SecurityManager
 import logging
 import tempfile
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+def _fast_load(f):
+    """Быстрая загрузка JSON из файлового объекта (orjson при наличии)"""
+    return _json.loads(f.read())
+
+def _fast_dump(obj, f):
+    """Быстрая запись JSON в файловый объект (orjson при наличии)"""
+    data = _json.dumps(obj)
+    f.write(data.decode() if isinstance(data, bytes) else data)
+
 @pytest.fixture
 def temp_config():
     """Создает временный конфигурационный файл"""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump({
+        _fast_dump({
             "google_maps_url": "https://www.google.com/maps/test",
             "telegram_token": "test_token",
             "chat_id": "test_chat_id"
@@ -25,7 +40,7 @@ def temp_config():
 def temp_cache():
     """Создает временный файл кэша"""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump([], f)
+        _fast_dump([], f)
     yield f.name
     os.unlink(f.name)
 
@@ -44,12 +59,12 @@ class TestFullFlow:
         
         # Загрузка конфигурации
         with open(temp_config, 'r') as f:
-            config = json.load(f)
+            config = _fast_load(f)
         assert config['google_maps_url'] == "https://www.google.com/maps/test"
         
         # Загрузка кэша
         with open(temp_cache, 'r') as f:
-            cache = json.load(f)
+            cache = _fast_load(f)
         assert isinstance(cache, list)
         
         # Тест парсинга отзывов
@@ -90,11 +105,11 @@ class TestFullFlow:
             'language': lang
         })
         with open(temp_cache, 'w') as f:
-            json.dump(cache, f)
+            _fast_dump(cache, f)
         
         # Проверка сохраненного кэша
         with open(temp_cache, 'r') as f:
-            saved_cache = json.load(f)
+            saved_cache = _fast_load(f)
         assert len(saved_cache) == 1
         assert saved_cache[0]['text'] == review.text
         assert saved_cache[0]['hash'] == hashed_review
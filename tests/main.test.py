@@ -1,29 +1,14 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, call
 from pathlib import Path
 import json
 from src.parser import Review, NetworkError, ParsingError
 from src.security import SecurityManager, SecurityError, ValidationError
-from main import load_config, load_cache, save_cache
-
-@pytest.fixture
-def mock_security_manager():
-    manager = Mock(spec=SecurityManager)
-    manager.validate_url.return_value = True
-    manager.validate_telegram_token.return_value = True
-    manager.validate_chat_id.return_value = True
-    manager.validate_review.return_value = True
-    manager.sanitize_text.side_effect = lambda x: x
-    manager.hash_data.side_effect = lambda x: f"hashed_{x}"
-    return manager
-
-@pytest.fixture
-def valid_config():
-    return {
-        'google_maps_url': 'https://maps.google.com/place',
-        'telegram_token': '123456:ABC-DEF1234ghIkl-zyx57W2v1u123ew11',
-        'chat_id': '123456789'
-    }
+from src.review_cache import ReviewCache
+from main import load_config, load_cache, save_cache, CACHE_FILE
+
+# Фикстуры mock_security_manager и valid_config определены в
+# tests/conftest.py и разделяются между тестами
 
 def test_load_config_success(mock_security_manager, valid_config, tmp_path):
     config_file = tmp_path / 'config.json'
@@ -34,58 +19,66 @@ def test_load_config_success(mock_security_manager, valid_config, tmp_path):
     
     result = load_config(mock_security_manager)
     assert result == valid_config
-    mock_security_manager.validate_url.assert_called_once_with(valid_config['google_maps_url'])
-    mock_security_manager.validate_telegram_token.assert_called_once_with(valid_config['telegram_token'])
-    mock_security_manager.validate_chat_id.assert_called_once_with(valid_config['chat_id'])
+    # Все три валидатора проверяются одним проходом по списку вызовов
+    mock_security_manager.assert_has_calls([
+        call.validate_url(valid_config['google_maps_url']),
+        call.validate_telegram_token(valid_config['telegram_token']),
+        call.validate_chat_id(valid_config['chat_id']),
+    ], any_order=True)
 
-def test_load_config_invalid_url(mock_security_manager, valid_config):
+@pytest.mark.parametrize("validator,message", [
+    ('validate_url', 'Invalid Google Maps URL'),
+    ('validate_telegram_token', 'Invalid Telegram token'),
+    ('validate_chat_id', 'Invalid chat ID'),
+])
+def test_load_config_invalid(mock_security_manager, valid_config, validator, message):
     mock_security_manager.load_secure_config.return_value = valid_config
-    mock_security_manager.validate_url.return_value = False
-    
-    with pytest.raises(ValidationError, match='Invalid Google Maps URL'):
-        load_config(mock_security_manager)
+    getattr(mock_security_manager, validator).return_value = False
 
-def test_load_config_invalid_token(mock_security_manager, valid_config):
-    mock_security_manager.load_secure_config.return_value = valid_config
-    mock_security_manager.validate_telegram_token.return_value = False
-    
-    with pytest.raises(ValidationError, match='Invalid Telegram token'):
+    with pytest.raises(ValidationError, match=message):
         load_config(mock_security_manager)
 
-def test_load_config_invalid_chat_id(mock_security_manager, valid_config):
-    mock_security_manager.load_secure_config.return_value = valid_config
-    mock_security_manager.validate_chat_id.return_value = False
-    
-    with pytest.raises(ValidationError, match='Invalid chat ID'):
-        load_config(mock_security_manager)
+def _cache_record(text, hash_hex):
+    return {
+        'text': text,
+        'hash': hash_hex,
+        'sentiment': 0.5,
+        'language': 'en',
+        'rating': 5.0,
+        'author': 'Test Author',
+        'date': '2024-01-01'
+    }
+
+def test_load_cache_success(mock_security_manager):
+    records = [_cache_record('review1', 'h1'), _cache_record('review2', 'h2')]
+    mock_security_manager.load_secure_cache.return_value = records
 
-def test_load_cache_success(mock_security_manager, tmp_path):
-    cache_file = tmp_path / 'reviews_cache.json'
-    cache_data = ['review1', 'review2']
-    with open(cache_file, 'w') as f:
-        json.dump(cache_data, f)
-    
     result = load_cache(mock_security_manager)
-    assert result == set(cache_data)
 
-def test_load_cache_invalid_format(mock_security_manager, tmp_path):
-    cache_file = tmp_path / 'reviews_cache.json'
-    with open(cache_file, 'w') as f:
-        json.dump('invalid_cache', f)
-    
-    with pytest.raises(ValidationError, match='Invalid cache format'):
-        load_cache(mock_security_manager)
+    assert len(result) == 2
+    assert result.texts == ['review1', 'review2']
+    mock_security_manager.load_secure_cache.assert_called_once_with(CACHE_FILE)
 
-def test_save_cache_success(mock_security_manager, tmp_path):
-    processed_reviews = {'review1', 'review2'}
-    cache_file = tmp_path / 'reviews_cache.json'
-    
-    save_cache(processed_reviews, mock_security_manager)
-    
-    assert cache_file.exists()
-    with open(cache_file) as f:
-        saved_data = json.load(f)
-        assert set(saved_data) == {'hashed_review1', 'hashed_review2'}
+def test_load_cache_invalid_format(mock_security_manager):
+    mock_security_manager.load_secure_cache.side_effect = \
+        ValidationError('Invalid cache format')
+
+    result = load_cache(mock_security_manager)
+
+    # Ошибка валидации не роняет загрузку: возвращается пустой кэш
+    assert len(result) == 0
+
+def test_save_cache_success(mock_security_manager):
+    cache = ReviewCache.from_records(
+        [_cache_record('review1', 'h1'), _cache_record('review2', 'h2')]
+    )
+
+    save_cache(mock_security_manager, cache)
+
+    mock_security_manager.append_secure_cache.assert_called_once_with(
+        CACHE_FILE, cache.to_records(0)
+    )
+    assert cache.persisted_count == 2
 
 def test_review_validation(mock_security_manager):
     review = Review(
@@ -3,15 +3,29 @@ from unittest.mock import patch, Mock
 from telegram.error import TelegramError
 from src.notifier import TelegramNotifier
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_bot():
-    with patch('src.notifier.Bot') as mock_bot_class:
-        bot = Mock()
-        mock_bot_class.return_value = bot
-        yield bot
+    """Патчит Bot один раз на модуль"""
+    patcher = patch('src.notifier.Bot')
+    mock_bot_class = patcher.start()
+    bot = Mock()
+    mock_bot_class.return_value = bot
+    yield bot
+    patcher.stop()
 
-def test_alert_sending_success(mock_bot):
-    notifier = TelegramNotifier(token='test_token', chat_id='123')
+@pytest.fixture(scope="module")
+def notifier(mock_bot):
+    """Общий нотификатор на модуль: конструктор выполняется один раз"""
+    return TelegramNotifier(token='test_token', chat_id='123')
+
+@pytest.fixture(autouse=True)
+def _reset_bot(request):
+    """Сбрасывает mock бота перед тестом, если он используется"""
+    if 'mock_bot' in request.fixturenames:
+        bot = request.getfixturevalue('mock_bot')
+        bot.reset_mock(return_value=True, side_effect=True)
+
+def test_alert_sending_success(mock_bot, notifier):
     review = {
         'text': 'Test review',
         'rating': 1.0,
@@ -24,7 +38,7 @@ def test_alert_sending_success(mock_bot):
     mock_bot.send_message.assert_called_once()
     
     # Проверяем формат сообщения
-    call_args = mock_bot.send_message.call_args[1]
+    call_args = mock_bot.send_message.call_args.kwargs
     assert call_args['chat_id'] == '123'
     assert 'Test review' in call_args['text']
     assert '1.0' in call_args['text']
@@ -38,15 +52,13 @@ def test_alert_sending_invalid_chat_id():
     with pytest.raises(ValueError):
         TelegramNotifier(token='test_token', chat_id='')
 
-def test_alert_sending_telegram_error(mock_bot):
+def test_alert_sending_telegram_error(mock_bot, notifier):
     mock_bot.send_message.side_effect = TelegramError("Test error")
-    notifier = TelegramNotifier(token='test_token', chat_id='123')
     
     result = notifier.send_alert({'text': 'Test', 'rating': 1.0})
     assert result is False
 
-def test_alert_sending_invalid_review(mock_bot):
-    notifier = TelegramNotifier(token='test_token', chat_id='123')
+def test_alert_sending_invalid_review(mock_bot, notifier):
     
     # Отсутствует обязательное поле
     result = notifier.send_alert({'text': 'Test'})
@@ -58,9 +70,8 @@ def test_alert_sending_invalid_review(mock_bot):
     assert result is False
     mock_bot.send_message.assert_not_called()
 
-def test_alert_sending_network_error(mock_bot):
+def test_alert_sending_network_error(mock_bot, notifier):
     mock_bot.send_message.side_effect = Exception("Network error")
-    notifier = TelegramNotifier(token='test_token', chat_id='123')
     
     result = notifier.send_alert({'text': 'Test', 'rating': 1.0})
     assert result is False
\ No newline at end of file
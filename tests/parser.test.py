@@ -5,22 +5,66 @@ from selenium.common.exceptions import (
     WebDriverException,
     StaleElementReferenceException
 )
+from bs4 import BeautifulSoup
 from src.parser import ReviewParser, Review, NetworkError, ParsingError
 
-@pytest.fixture
+# Страницы в разметке, которую извлекают селекторы парсера; в каждом
+# негативном варианте сломано ровно одно проверяемое поле
+DEFAULT_HTML = '''
+<div class="review-container">
+    <span class="review-text">Test review</span>
+    <span class="rating">4.0</span>
+    <span class="author-name">Test Author</span>
+    <span class="review-date">2024-01-01</span>
+</div>
+'''
+
+MISSING_ELEMENTS_HTML = '''
+<div class="review-container">
+    <span class="review-text">Test review</span>
+</div>
+'''
+
+INVALID_RATING_HTML = '''
+<div class="review-container">
+    <span class="review-text">Test review</span>
+    <span class="rating">not a number</span>
+    <span class="review-date">2024-01-01</span>
+</div>
+'''
+
+MISSING_AUTHOR_HTML = '''
+<div class="review-container">
+    <span class="review-text">Test review</span>
+    <span class="rating">4.0</span>
+    <span class="review-date">2024-01-01</span>
+</div>
+'''
+
+# Дерево строится один раз на модуль: тесты, которым не нужен полный
+# путь через драйвер, работают с готовым soup
+DEFAULT_SOUP = BeautifulSoup(DEFAULT_HTML, 'html.parser')
+
+@pytest.fixture(scope="module")
 def mock_driver():
-    with patch('src.parser.webdriver.Chrome') as mock_chrome:
-        driver = Mock()
-        driver.page_source = '''
-        <div class="ODSEW-ShBeI NIyLF-haAclf gm2-body-2">
-            <span class="ODSEW-ShBeI-text">Test review</span>
-            <span class="ODSEW-ShBeI-H1e3jb" aria-label="Rating 4.0"></span>
-            <span class="ODSEW-ShBeI-RgZmSc-date">2024-01-01</span>
-            <span class="ODSEW-ShBeI-title">Test Author</span>
-        </div>
-        '''
-        mock_chrome.return_value = driver
-        yield driver
+    """Патчит webdriver.Chrome один раз на модуль"""
+    patcher = patch('src.parser.webdriver.Chrome')
+    mock_chrome = patcher.start()
+    driver = Mock()
+    mock_chrome.return_value = driver
+    yield driver
+    patcher.stop()
+
+@pytest.fixture(autouse=True)
+def _reset_driver(mock_driver):
+    """Возвращает mock драйвера к дефолтному состоянию перед тестом"""
+    mock_driver.reset_mock(return_value=True, side_effect=True)
+    mock_driver.page_source = DEFAULT_HTML
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Отключает паузы между ретраями: тесты не должны реально спать"""
+    monkeypatch.setattr('src.parser.time.sleep', lambda *args: None)
 
 def test_parser_returns_valid_data(mock_driver):
     parser = ReviewParser()
@@ -35,7 +79,19 @@ def test_parser_returns_valid_data(mock_driver):
     assert review.rating == 4.0
     assert review.date == '2024-01-01'
     assert review.author == 'Test Author'
-    assert review.source == 'google_maps'
+
+def test_parse_soup_direct(mock_driver):
+    # Разбор готового дерева без прохода через драйвер
+    parser = ReviewParser()
+    reviews = parser._parse_soup(DEFAULT_SOUP)
+
+    assert len(reviews) == 1
+    review = reviews[0]
+    assert isinstance(review, Review)
+    assert review.text == 'Test review'
+    assert review.rating == 4.0
+    assert review.author == 'Test Author'
+    assert review.date == '2024-01-01'
 
 def test_parser_handles_empty_response(mock_driver):
     mock_driver.page_source = ''
@@ -46,11 +102,7 @@ def test_parser_handles_empty_response(mock_driver):
     assert len(reviews) == 0
 
 def test_parser_handles_missing_elements(mock_driver):
-    mock_driver.page_source = '''
-    <div class="ODSEW-ShBeI NIyLF-haAclf gm2-body-2">
-        <span class="ODSEW-ShBeI-text">Test review</span>
-    </div>
-    '''
+    mock_driver.page_source = MISSING_ELEMENTS_HTML
     parser = ReviewParser()
     reviews = parser.parse_reviews('test_url')
     
@@ -58,50 +110,42 @@ def test_parser_handles_missing_elements(mock_driver):
     assert len(reviews) == 0
 
 def test_parser_handles_invalid_rating(mock_driver):
-    mock_driver.page_source = '''
-    <div class="ODSEW-ShBeI NIyLF-haAclf gm2-body-2">
-        <span class="ODSEW-ShBeI-text">Test review</span>
-        <span class="ODSEW-ShBeI-H1e3jb" aria-label="Invalid rating"></span>
-        <span class="ODSEW-ShBeI-RgZmSc-date">2024-01-01</span>
-    </div>
-    '''
+    mock_driver.page_source = INVALID_RATING_HTML
     parser = ReviewParser()
     reviews = parser.parse_reviews('test_url')
     
     assert isinstance(reviews, list)
     assert len(reviews) == 0
 
-def test_parser_handles_timeout(mock_driver):
-    mock_driver.get.side_effect = TimeoutException()
+@pytest.mark.parametrize("exc,message", [
+    (TimeoutException(), "Timeout while loading reviews"),
+    (WebDriverException("Test error"), "WebDriver error"),
+])
+def test_parser_network_errors(mock_driver, exc, message):
+    mock_driver.get.side_effect = exc
     parser = ReviewParser(max_retries=1)
-    
-    with pytest.raises(NetworkError) as exc_info:
-        parser.parse_reviews('test_url')
-    assert "Failed to load reviews page" in str(exc_info.value)
 
-def test_parser_handles_webdriver_error(mock_driver):
-    mock_driver.get.side_effect = WebDriverException("Test error")
-    parser = ReviewParser(max_retries=1)
-    
     with pytest.raises(NetworkError) as exc_info:
         parser.parse_reviews('test_url')
-    assert "WebDriver error occurred" in str(exc_info.value)
+    assert message in str(exc_info.value)
+
+def test_parser_handles_missing_author(mock_driver):
+    # Автор не обязателен: при его отсутствии подставляется Anonymous
+    mock_driver.page_source = MISSING_AUTHOR_HTML
+    parser = ReviewParser()
+    reviews = parser.parse_reviews('test_url')
+
+    assert len(reviews) == 1
+    assert reviews[0].author == 'Anonymous'
 
 def test_parser_handles_stale_element(mock_driver):
-    mock_driver.page_source = '''
-    <div class="ODSEW-ShBeI NIyLF-haAclf gm2-body-2">
-        <span class="ODSEW-ShBeI-text">Test review</span>
-        <span class="ODSEW-ShBeI-H1e3jb" aria-label="Rating 4.0"></span>
-        <span class="ODSEW-ShBeI-RgZmSc-date">2024-01-01</span>
-    </div>
-    '''
     parser = ReviewParser()
-    
-    # Симулируем устаревший элемент
-    with patch('bs4.element.Tag.find') as mock_find:
-        mock_find.side_effect = StaleElementReferenceException()
+
+    # Симулируем устаревший элемент при чтении полей отзыва
+    with patch.object(ReviewParser, '_get_element_text') as mock_text:
+        mock_text.side_effect = StaleElementReferenceException()
         reviews = parser.parse_reviews('test_url')
-        
+
     assert isinstance(reviews, list)
     assert len(reviews) == 0
 
@@ -123,10 +167,10 @@ def test_parser_cleans_up_driver():
     with patch('src.parser.webdriver.Chrome') as mock_chrome:
         driver = Mock()
         mock_chrome.return_value = driver
-        
+
         parser = ReviewParser()
-        del parser
-        
+        parser.cleanup()
+
         driver.quit.assert_called_once()
 
 def test_parser_handles_driver_cleanup_error():
@@ -134,8 +178,8 @@ def test_parser_handles_driver_cleanup_error():
         driver = Mock()
         driver.quit.side_effect = Exception("Cleanup error")
         mock_chrome.return_value = driver
-        
+
         parser = ReviewParser()
-        del parser  # Не должно вызвать исключение
-        
+        parser.cleanup()  # Не должно вызвать исключение
+
         driver.quit.assert_called_once()
\ No newline at end of file
@@ -0,0 +1,29 @@
+import pytest
+from src.analyzer import SentimentAnalyzer
+from src.translator import TextTranslator
+
+@pytest.fixture(scope="session")
+def small_texts():
+    """Небольшой набор текстов для проверок кэша и типов"""
+    return [
+        "Great service! Very satisfied with the experience.",
+        "Terrible experience, would not recommend.",
+        "Average service, nothing special.",
+        "Excellent! Best service ever!",
+        "Poor service, very disappointed."
+    ]
+
+@pytest.fixture(scope="session")
+def large_texts(small_texts):
+    """Большой набор текстов для нагрузочных прогонов"""
+    return small_texts * 20  # Умножаем для нагрузки
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """Общий анализатор на сессию: модели загружаются один раз"""
+    return SentimentAnalyzer(max_workers=4)
+
+@pytest.fixture(scope="session")
+def translator():
+    """Общий переводчик на сессию"""
+    return TextTranslator()